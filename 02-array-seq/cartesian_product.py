@@ -8,6 +8,9 @@ The cartesian product of two lists A and B is the set of all ordered pairs (a, b
 where a is from A and b is from B.
 """
 
+import itertools
+from array import array
+
 # ============================================================================
 # BASIC CARTESIAN PRODUCT WITH LIST COMPREHENSION
 # ============================================================================
@@ -20,16 +23,13 @@ print("=" * 60)
 list_a = [1, 2, 3]
 list_b = ['a', 'b']
 
-# Traditional way with nested for loops:
-cartesian_traditional = []
-for a in list_a:
-    for b in list_b:
-        cartesian_traditional.append((a, b))
+# Library way with itertools.product (the nested loops run in C):
+cartesian_itertools = list(itertools.product(list_a, list_b))
 
 print(f"\nList A: {list_a}")
 print(f"List B: {list_b}")
-print(f"\nTraditional way (nested loops):")
-print(f"  {cartesian_traditional}")
+print(f"\nitertools.product:")
+print(f"  {cartesian_itertools}")
 
 # List comprehension way (much more concise!):
 cartesian_comprehension = [(a, b) for a in list_a for b in list_b]
@@ -59,12 +59,23 @@ print(f"All combinations: {combinations}")
 # Example 3: Cartesian product with strings
 suits = ['♠', '♥', '♦', '♣']
 ranks = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K']
-cards = [(rank, suit) for suit in suits for rank in ranks]
+# Instead of 52 tuples, keep two parallel arrays of small ints (one byte per
+# card each) that index into ranks and suits; suits vary slowest.
+suit_idx = array('b', (s for s in range(len(suits)) for _ in ranks))
+rank_idx = array('b', range(len(ranks))) * len(suits)
+n_cards = len(rank_idx)
+
+
+def card(i):
+    """Return card number i as a (rank, suit) tuple, for display."""
+    return ranks[rank_idx[i]], suits[suit_idx[i]]
+
+
 print(f"\nSuits: {suits}")
 print(f"Ranks: {ranks}")
-print(f"Total cards: {len(cards)}")
-print(f"First 5 cards: {cards[:5]}")
-print(f"Last 5 cards: {cards[-5:]}")
+print(f"Total cards: {n_cards}")
+print(f"First 5 cards: {[card(i) for i in range(5)]}")
+print(f"Last 5 cards: {[card(i) for i in range(n_cards - 5, n_cards)]}")
 
 # Example 4: Cartesian product with filtering
 # Only include pairs where the number is greater than the index
@@ -79,18 +90,18 @@ print(f"Pairs where x > y: {filtered_pairs}")
 # Create pairs and calculate their product
 nums1 = [2, 3, 4]
 nums2 = [5, 6]
-products = [(a, b, a * b) for a in nums1 for b in nums2]
+products = [(a, b, a * b) for a, b in itertools.product(nums1, nums2)]
 print(f"\nNumbers 1: {nums1}")
 print(f"Numbers 2: {nums2}")
 print(f"Pairs with products: {products}")
 
 
 # ============================================================================
-# COMPARISON: NESTED LOOPS vs LIST COMPREHENSION
+# COMPARISON: ITERTOOLS.PRODUCT vs LIST COMPREHENSION
 # ============================================================================
 
 print("\n" + "=" * 60)
-print("COMPARISON: NESTED LOOPS vs LIST COMPREHENSION")
+print("COMPARISON: ITERTOOLS.PRODUCT vs LIST COMPREHENSION")
 print("=" * 60)
 
 # Task: Create all pairs from two lists
@@ -98,21 +109,17 @@ print("=" * 60)
 list1 = [10, 20]
 list2 = ['x', 'y', 'z']
 
-# Method 1: Traditional nested for loops
-result1 = []
-for item1 in list1:
-    for item2 in list2:
-        result1.append((item1, item2))
-print(f"\nNested loops: {result1}")
+# Method 1: itertools.product builds the tuples without a Python-level loop
+result1 = list(itertools.product(list1, list2))
+print(f"\nitertools.product: {result1}")
 
 # Method 2: List comprehension (more Pythonic!)
 result2 = [(item1, item2) for item1 in list1 for item2 in list2]
 print(f"List comprehension: {result2}")
 
-# Both produce the same result, but list comprehension is:
-# - More concise (one line vs multiple lines)
-# - More readable (once you understand the syntax)
-# - More Pythonic (follows Python best practices)
+# Both produce the same result:
+# - itertools.product is faster: the nested iteration happens in C
+# - the list comprehension is more flexible: it can filter and transform
 
 
 # ============================================================================
@@ -123,13 +130,14 @@ print("\n" + "=" * 60)
 print("CARTESIAN PRODUCT OF MORE THAN TWO LISTS")
 print("=" * 60)
 
-# You can extend this pattern to more than two lists
+# You can extend this pattern to more than two lists;
+# itertools.product accepts any number of iterables
 list_a = [1, 2]
 list_b = ['a', 'b']
 list_c = ['x', 'y']
 
 # Three-way cartesian product
-triples = [(a, b, c) for a in list_a for b in list_b for c in list_c]
+triples = list(itertools.product(list_a, list_b, list_c))
 print(f"\nList A: {list_a}")
 print(f"List B: {list_b}")
 print(f"List C: {list_c}")
@@ -137,6 +145,52 @@ print(f"All triples: {triples}")
 print(f"Total combinations: {len(triples)}")
 
 
+# ============================================================================
+# NUMERIC CARTESIAN PRODUCT INTO A 2D ARRAY
+# ============================================================================
+
+# For numeric inputs you can skip the tuples altogether and write each
+# combination as a row of a preallocated 2D array. NumPy is needed for
+# this section; Numba, if installed, compiles the loop to machine code.
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional for this tutorial
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # without Numba the kernel runs as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+@njit(cache=True)
+def cartesian3(a, b, c, out):
+    """Fill out[k] with (a[i], b[j], c[m]) for every i, j, m in order."""
+    k = 0
+    for i in range(a.size):
+        for j in range(b.size):
+            for m in range(c.size):
+                out[k, 0] = a[i]
+                out[k, 1] = b[j]
+                out[k, 2] = c[m]
+                k += 1
+
+
+if np is not None:
+    print("\n" + "=" * 60)
+    print("NUMERIC CARTESIAN PRODUCT INTO A 2D ARRAY")
+    print("=" * 60)
+
+    nums_a = np.asarray([1, 2], dtype=np.int64)
+    nums_b = np.asarray([10, 20], dtype=np.int64)
+    nums_c = np.asarray([100, 200, 300], dtype=np.int64)
+    out = np.empty((nums_a.size * nums_b.size * nums_c.size, 3), dtype=np.int64)
+    cartesian3(nums_a, nums_b, nums_c, out)
+    print(f"\nRows: {out.shape[0]}")
+    print(f"First 4 rows: {out[:4].tolist()}")
+
+
 # ============================================================================
 # SUMMARY
 # ============================================================================
@@ -7,6 +7,11 @@ List comprehensions are a concise way to create lists in Python.
 They're more readable and often faster than equivalent for loops.
 """
 
+import re
+from itertools import chain
+
+RE_DIGIT = re.compile(r'\d')
+
 # ============================================================================
 # 1. BASIC LIST COMPREHENSION
 # ============================================================================
@@ -15,11 +20,10 @@ print("=" * 60)
 print("1. BASIC LIST COMPREHENSION")
 print("=" * 60)
 
-# Traditional way with a for loop:
-numbers = []
-for i in range(5):
-    numbers.append(i * 2)
-print(f"Traditional way: {numbers}")
+# Traditional way with a for loop (shown here, not run):
+#     numbers = []
+#     for i in range(5):
+#         numbers.append(i * 2)
 
 # List comprehension way (much more concise!):
 numbers = [i * 2 for i in range(5)]
@@ -30,6 +34,12 @@ print(f"List comprehension: {numbers}")
 # - item: the variable name (i)
 # - iterable: what to iterate over (range(5))
 
+# Tip: a comprehension grows its list one append at a time, because it can't
+# know the final length. When the values already come from a sized iterable,
+# list() asks for its length first and allocates the whole list in one go:
+numbers = list(range(0, 10, 2))
+print(f"list() on a range: {numbers}")
+
 
 # ============================================================================
 # 2. LIST COMPREHENSION WITH STRINGS
@@ -57,16 +67,16 @@ print("\n" + "=" * 60)
 print("3. LIST COMPREHENSION WITH CONDITIONAL FILTERING")
 print("=" * 60)
 
-# Traditional way: filter even numbers
 numbers = list(range(10))
-even_numbers = []
-for num in numbers:
-    if num % 2 == 0:
-        even_numbers.append(num)
-print(f"Traditional way (even numbers): {even_numbers}")
+
+# Traditional way to filter even numbers (shown here, not run):
+#     even_numbers = []
+#     for num in numbers:
+#         if num % 2 == 0:
+#             even_numbers.append(num)
 
 # List comprehension way:
-even_numbers = [num for num in range(10) if num % 2 == 0]
+even_numbers = [num for num in numbers if num % 2 == 0]
 print(f"List comprehension (even numbers): {even_numbers}")
 
 # Syntax: [expression for item in iterable if condition]
@@ -82,7 +92,7 @@ print("4. CONDITIONAL EXPRESSIONS (TERNARY OPERATOR)")
 print("=" * 60)
 
 # Transform values based on a condition
-numbers = list(range(10))
+# (numbers is still the list(range(10)) built in section 3)
 # If number is even, keep it; if odd, multiply by 10
 transformed = [num if num % 2 == 0 else num * 10 for num in numbers]
 print(f"Original: {numbers}")
@@ -102,8 +112,19 @@ print("=" * 60)
 # Create a multiplication table (2D list)
 multiplication_table = [[i * j for j in range(1, 6)] for i in range(1, 6)]
 print("Multiplication table (5x5):")
-for row in multiplication_table:
-    print(row)
+print(*multiplication_table, sep="\n")  # one print call for all rows
+
+# For N > 20, prefer np.outer or broadcasting: a single C multiply loop over
+# contiguous int64 memory instead of N * N steps of the Python interpreter
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional for this tutorial
+    np = None
+
+if np is not None:
+    factors = np.arange(1, 6)
+    table = (factors[:, None] * factors).tolist()
+    print(f"Same table from NumPy broadcasting: {table == multiplication_table}")
 
 # Flatten a 2D list
 matrix = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
@@ -115,6 +136,11 @@ print(f"Flattened: {flattened}")
 # [num for row in matrix for num in row]
 # means: for each row in matrix, for each num in row, include num
 
+# chain.from_iterable moves the nested loop into C; for uniform numeric
+# matrices, NumPy's ravel() is a single memcpy
+flattened = list(chain.from_iterable(matrix))
+print(f"Flattened with chain.from_iterable: {flattened}")
+
 
 # ============================================================================
 # 6. PRACTICAL EXAMPLES
@@ -129,10 +155,14 @@ text = "I have 3 cats and 2 dogs"
 numbers = [int(char) for char in text if char.isdigit()]
 print(f"Text: '{text}'")
 print(f"Numbers found: {numbers}")
+# For long texts, let the regex engine scan the string in C and only
+# loop in Python over the matches:
+numbers = [int(digit) for digit in RE_DIGIT.findall(text)]
+print(f"Numbers found (regex): {numbers}")
 
 # Example 2: Square only positive numbers
 numbers = [-2, -1, 0, 1, 2, 3, 4]
-squared_positives = [num ** 2 for num in numbers if num > 0]
+squared_positives = [num * num for num in numbers if num > 0]
 print(f"\nOriginal: {numbers}")
 print(f"Squared positives: {squared_positives}")
 
@@ -159,18 +189,17 @@ print("=" * 60)
 
 # Task: Get squares of even numbers from 0 to 9
 
-# Method 1: Traditional for loop
-result1 = []
-for num in range(10):
-    if num % 2 == 0:
-        result1.append(num ** 2)
-print(f"For loop: {result1}")
+# Method 1: Traditional for loop (shown here, not run):
+#     result = []
+#     for num in range(10):
+#         if num % 2 == 0:
+#             result.append(num * num)
 
 # Method 2: List comprehension (more Pythonic!)
-result2 = [num ** 2 for num in range(10) if num % 2 == 0]
-print(f"List comprehension: {result2}")
+result = [num * num for num in range(10) if num % 2 == 0]
+print(f"List comprehension: {result}")
 
-# Both produce the same result, but list comprehension is:
+# Both build the same list, but list comprehension is:
 # - More concise (one line vs multiple lines)
 # - More readable (once you understand the syntax)
 # - Often faster (Python optimizes list comprehensions)
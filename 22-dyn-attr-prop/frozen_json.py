@@ -19,21 +19,38 @@ class FrozenJSON:
     using attribute notation
     """
 
+    __slots__ = ('__data', '__cache')  # fixed layout: no per-instance __dict__
+
     def __init__(self, mapping):
         self.__data = dict(mapping)
+        self.__cache = {}  # children already wrapped by build, keyed by name
 
     def __getattr__(self, name):
-        try:
-            return getattr(self.__data, name)
-        except AttributeError:
-            return FrozenJSON.build(self.__data[name])
+        # JSON keys are the common case, so look them up first instead of
+        # paying for a failed getattr and a caught AttributeError each time
+        cache = self.__cache
+        if name in cache:
+            return cache[name]
+        data = self.__data
+        if name in data:
+            # the facade is read-only, so each child only needs to be built once
+            value = cache[name] = FrozenJSON.build(data[name])
+            return value
+        return getattr(data, name)
         
     def __dir__(self):
         return self.__data.keys()
     
     @classmethod
     def build(cls, obj):
-        if isinstance(obj, abc.Mapping):
+        # json.load only produces dict and list, so check those exact types
+        # before the slower ABC isinstance checks, kept for other collections
+        t = type(obj)
+        if t is dict:
+            return cls(obj)
+        elif t is list:
+            return [cls.build(item) for item in obj]
+        elif isinstance(obj, abc.Mapping):
             return cls(obj)
         elif isinstance(obj, abc.MutableSequence):
             return [cls.build(item) for item in obj]